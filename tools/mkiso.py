@@ -11,13 +11,31 @@ UEFIブート可能なISOイメージを作成します。可能であればEFI
 from __future__ import annotations
 
 import argparse
+import errno
+import json
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# top-level entries under bin/ that never belong in the ISO
+_SKIP_BIN_ENTRIES = frozenset({".mnt", "fs_tmp"})
+
+# errors meaning "this kernel/filesystem can't do that copy syscall", not a real I/O failure
+_FASTCOPY_FALLBACK_ERRNOS = frozenset({errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP})
+
+# ioctl(FICLONE) from <linux/fs.h>: share the source extents with the destination (Btrfs, XFS, ...)
+_FICLONE = 0x40049409
+_REFLINK_FALLBACK_ERRNOS = _FASTCOPY_FALLBACK_ERRNOS | {errno.ENOTTY}
+
+# shutil.which() results, keyed by tool name; each lookup walks and stat()s all of $PATH
+_TOOLS = {}
+_SENTINEL = object()
+
 
 def find_file_candidates(root: Path) -> dict:
     """Look for BOOTX64.EFI and kernel binary in common locations."""
@@ -53,8 +71,25 @@ def find_file_candidates(root: Path) -> dict:
     return res
 
 
+def _which(name: str):
+    """Cached shutil.which()."""
+    r = _TOOLS.get(name, _SENTINEL)
+    if r is _SENTINEL:
+        r = _TOOLS[name] = shutil.which(name)
+    return r
+
+
+def _which_first(names):
+    """Return the path of the first tool in `names` found on $PATH, or None."""
+    for name in names:
+        path = _which(name)
+        if path:
+            return path
+    return None
+
+
 def check_command(cmd: str) -> bool:
-    return shutil.which(cmd) is not None
+    return _which(cmd) is not None
 
 
 def run(cmd, **kwargs):
@@ -62,105 +97,229 @@ def run(cmd, **kwargs):
     subprocess.run(cmd, check=True, **kwargs)
 
 
+def _open_new(dst, mode=0o666):
+    """Open dst for writing as a new file and return the fd.
+
+    An existing dst is unlinked rather than truncated: in the ISO staging tree it may be a
+    hard link to one of the source files, and writing through it would overwrite that file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        return os.open(dst, flags, mode)
+    except FileExistsError:
+        os.unlink(dst)
+        return os.open(dst, flags, mode)
+
+
+def _fastcopy(src, dst):
+    """Copy src to dst like shutil.copy2, keeping the data transfer inside the kernel.
+
+    Tries copy_file_range(2), then sendfile(2), and only falls back to a userspace
+    read/write loop if neither is usable for this pair of files. Returns the size copied.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(_open_new(dst), "wb", buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                    raise
+
+        if copied < size and hasattr(os, "sendfile"):
+            try:
+                while copied < size:
+                    n = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                    raise
+
+        if copied < size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+
+    shutil.copystat(src, dst)
+    return size
+
+
+def _reflink(src, dst):
+    """Clone src into dst with FICLONE so no data is copied; use _fastcopy where unsupported.
+
+    Meant for the large images (kernel, fs image, EFI FAT image), which would otherwise
+    cost a full read+write on copy-on-write filesystems. Returns the file size.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return _fastcopy(src, dst)
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd = _open_new(dst, 0o644)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        finally:
+            os.close(dst_fd)
+    except OSError as e:
+        if e.errno not in _REFLINK_FALLBACK_ERRNOS:
+            raise
+        return _fastcopy(src, dst)
+    finally:
+        os.close(src_fd)
+
+    shutil.copystat(src, dst)
+    return size
+
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst; copy it with _fastcopy if linking is not possible.
+
+    The ISO staging tree is only read by the ISO tool and then thrown away, so a link
+    is as good as a copy there. Symlinks are always copied: link(2) would link the symlink
+    itself, not the file it points to. Returns the file size.
+    """
+    # one lstat answers both "is it a symlink?" and the size for the caller
+    st = os.lstat(src)
+    if stat.S_ISLNK(st.st_mode):
+        return _fastcopy(src, dst)
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        # dst may itself be a link to a source file: replace it, never write through it
+        os.unlink(dst)
+        return _link_or_copy(src, dst)
+    except OSError:
+        return _fastcopy(src, dst)
+    return st.st_size
+
+
+def _allocate_image(path, size_mb: int, preallocate: bool = False, strict: bool = False):
+    """Create (or truncate) `path` as a zero-filled disk image of size_mb MiB.
+
+    The file is sparse by default, so nothing is written. With preallocate=True the blocks
+    are reserved with posix_fallocate; if the platform or filesystem cannot do that, a sparse
+    file is created instead, unless `strict` is set (the user asked for --fallocate), in which
+    case the error is raised.
+    """
+    size = size_mb * 1024 * 1024
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if preallocate:
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except AttributeError:
+                if strict:
+                    raise OSError(errno.ENOSYS, "posix_fallocate is not available on this platform")
+            except OSError as e:
+                if strict or e.errno not in (errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                    raise
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _stage_esp(stage: Path, bootx64: Path, kernel: Path | None, fsimg: Path | None = None) -> Path:
+    """Lay out the ESP contents under `stage` (EFI/BOOT/BOOTX64.EFI, kernel.bin, fs image) for mcopy -s."""
+    if stage.exists():
+        shutil.rmtree(stage)
+    (stage / "EFI" / "BOOT").mkdir(parents=True)
+    # link only when the sources share the stage's filesystem, instead of letting every
+    # os.link() fail with EXDEV
+    place = _link_or_copy if os.stat(bootx64).st_dev == os.stat(stage).st_dev else _fastcopy
+    place(bootx64, stage / "EFI" / "BOOT" / "BOOTX64.EFI")
+    if kernel:
+        place(kernel, stage / "kernel.bin")
+    if fsimg:
+        place(fsimg, stage / Path(fsimg).name)
+    return stage
+
+
 def create_efi_fat_image(efi_img: Path, bootx64: Path, kernel: Path | None, size_mb: int = 32):
     """Create a FAT image and copy EFI and kernel into it.
 
     Uses mkfs.vfat + mcopy if available (no root required). Returns True on success.
     """
-    mkfs = shutil.which("mkfs.vfat") or shutil.which("mkfs.fat")
-    mcopy = shutil.which("mcopy")
+    mkfs = _which_first(("mkfs.vfat", "mkfs.fat"))
+    mcopy = _which("mcopy")
     if not mkfs or not mcopy:
         return False
 
-    # create sparse file
-    with open(efi_img, "wb") as f:
-        f.truncate(size_mb * 1024 * 1024)
+    # Allocate the image up front instead of leaving a sparse hole: mkfs.vfat's scattered
+    # metadata writes then land on already-allocated blocks, and running out of space shows
+    # up here rather than halfway through mkfs. The cost is that the blocks are really
+    # reserved on disk.
+    _allocate_image(efi_img, size_mb, preallocate=True)
 
     run([mkfs, "-F", "32", str(efi_img)])
 
-    # use mcopy to copy files into the image. -i selects the image file.
-    # ensure target dirs exist using mmd
-    mmd = shutil.which("mmd")
-    if mmd:
-        run([mmd, "-i", str(efi_img), "::/EFI"])  # create EFI
-        run([mmd, "-i", str(efi_img), "::/EFI/BOOT"])  # create EFI/BOOT
-    else:
-        # fallback: mcopy can create dirs with -s when copying full path
-        pass
-
-    run([shutil.which("mcopy"), "-i", str(efi_img), str(bootx64), "::/EFI/BOOT/BOOTX64.EFI"]) 
-    if kernel:
-        run([shutil.which("mcopy"), "-i", str(efi_img), str(kernel), "::/kernel.bin"]) 
+    # lay the files out in their final shape next to the image, then copy them all with a
+    # single recursive mcopy (-s creates EFI/BOOT on the way) instead of mmd+mcopy per file
+    stage = _stage_esp(efi_img.parent / "efi_stage", bootx64, kernel)
+    run([mcopy, "-i", str(efi_img), "-s", *sorted(str(p) for p in stage.iterdir()), "::/"])
 
     return True
 
 
-def create_raw_usb_image(img_path: Path, bootx64: Path, kernel: Path | None, fsimg: Path | None = None, size_mb: int = 256):
+def create_raw_usb_image(img_path: Path, bootx64: Path, kernel: Path | None, fsimg: Path | None = None, size_mb: int = 256,
+                         fallocate: bool = False):
     """Create a raw USB image file with GPT + one FAT32 ESP partition and copy EFI/kernel into it.
 
-    This operation requires root privileges for losetup/parted/mkfs/mount. The function will use
-    'sudo' for privileged commands. The caller must ensure sudo is available and the user has rights.
+    Everything is done on the image file itself (parted, sfdisk, mkfs.vfat --offset, mcopy),
+    so no root privileges, loop devices or mounts are needed.
     """
+    parted = _which("parted")
+    sfdisk = _which("sfdisk")
+    mkfs = _which_first(("mkfs.vfat", "mkfs.fat"))
+    mcopy = _which("mcopy")
+    missing = [name for name, path in (("parted", parted), ("sfdisk", sfdisk), ("mkfs.vfat", mkfs), ("mcopy", mcopy))
+               if not path]
+    if missing:
+        raise RuntimeError("missing tools for raw USB image: " + ", ".join(missing))
+
     img_path = Path(img_path)
-    work = tempfile.mkdtemp(prefix="litecore-")
-    loop_dev = None
-    mount_point = None
+    work = Path(tempfile.mkdtemp(prefix="litecore-", dir=img_path.parent))  # same fs as the image, like main's workdir
     try:
-        print("Creating zero-filled image:", img_path, f"({size_mb} MiB)")
-        run(["dd", "if=/dev/zero", f"of={str(img_path)}", "bs=1M", f"count={size_mb}"])
+        # a sparse file reads back as zeros, so there is no need to write them out with dd;
+        # parted/mkfs only write their own metadata. --fallocate reserves the space instead.
+        print("Creating image:", img_path, f"({size_mb} MiB{', preallocated' if fallocate else ''})")
+        _allocate_image(img_path, size_mb, preallocate=fallocate, strict=True)
 
         print("Creating GPT and FAT partition (parted)")
-        run(["sudo", "parted", "--script", str(img_path), "mklabel", "gpt"]) 
-        run(["sudo", "parted", "--script", str(img_path), "mkpart", "ESP", "fat32", "1MiB", "100%"])
-        run(["sudo", "parted", "--script", str(img_path), "set", "1", "boot", "on"])
-
-        print("Attaching loop device (with partition scan)")
-        loop_dev = subprocess.check_output(["sudo", "losetup", "--partscan", "--find", "--show", str(img_path)], text=True).strip()
-        print("loop device:", loop_dev)
-
-        # partition device is usually {loop}p1 (e.g. /dev/loop0p1)
-        part_dev = f"{loop_dev}p1"
-        # wait for partition device node
-        import time
-        for _ in range(10):
-            if Path(part_dev).exists():
-                break
-            time.sleep(0.2)
-        else:
-            raise RuntimeError(f"Partition device {part_dev} not found")
-
-        print("Formatting ESP partition as FAT32:", part_dev)
-        run(["sudo", "mkfs.vfat", "-F", "32", part_dev])
+        run([parted, "--script", "--align", "optimal", str(img_path),
+             "mklabel", "gpt", "mkpart", "ESP", "fat32", "1MiB", "100%", "set", "1", "boot", "on"])
 
-        mount_point = Path(tempfile.mkdtemp(dir=work))
-        print("Mounting", part_dev, "->", mount_point)
-        run(["sudo", "mount", part_dev, str(mount_point)])
+        # read back where parted put the ESP; mkfs and mcopy address it by offset
+        table = json.loads(subprocess.check_output([sfdisk, "-J", str(img_path)], text=True))["partitiontable"]
+        part = table["partitions"][0]
+        sector_size = table.get("sectorsize", 512)
+        start, sectors = part["start"], part["size"]
 
-        print("Creating EFI directories and copying files")
-        run(["sudo", "mkdir", "-p", str(mount_point / "EFI" / "BOOT")])
-        run(["sudo", "cp", str(bootx64), str(mount_point / "EFI" / "BOOT" / "BOOTX64.EFI")])
-        if kernel:
-            run(["sudo", "cp", str(kernel), str(mount_point / "kernel.bin")])
-        if fsimg and Path(fsimg).exists():
-            run(["sudo", "cp", str(fsimg), str(mount_point / Path(fsimg).name)])
+        print("Formatting ESP partition as FAT32 at sector", start)
+        # BLOCK-COUNT (1 KiB units) keeps mkfs inside the partition, clear of the backup GPT
+        run([mkfs, "-F", "32", f"--offset={start}", "-h", str(start), str(img_path),
+             str(sectors * sector_size // 1024)])
 
-        run(["sudo", "sync"]) 
-        run(["sudo", "umount", str(mount_point)])
-        mount_point = None
+        print("Copying EFI files into the ESP (mcopy)")
+        stage = _stage_esp(work / "esp", bootx64, kernel, fsimg if fsimg and Path(fsimg).exists() else None)
+        run([mcopy, "-i", f"{img_path}@@{start * sector_size}", "-s", *sorted(str(p) for p in stage.iterdir()), "::/"],
+            env={**os.environ, "MTOOLS_SKIP_CHECK": "1"})
 
     finally:
         # cleanup
-        if mount_point and Path(mount_point).exists():
-            try:
-                run(["sudo", "umount", str(mount_point)])
-            except Exception:
-                pass
-        if loop_dev:
-            try:
-                run(["sudo", "losetup", "-d", loop_dev])
-            except Exception:
-                pass
-        if Path(work).exists():
+        if work.exists():
             try:
                 shutil.rmtree(work)
             except Exception:
@@ -169,20 +328,22 @@ def create_raw_usb_image(img_path: Path, bootx64: Path, kernel: Path | None, fsi
     return img_path
 
 
-def build_iso(iso_path: Path, isoroot: Path, efiboot_img: Path | None = None, volume_label: str = "LITECORE"):
+def build_iso(iso_path: Path, isoroot: Path | None, efiboot_img: Path | None = None, volume_label: str = "LITECORE",
+              path_list: dict | None = None):
     """Create ISO using xorriso/genisoimage/mkisofs.
 
-    Prefer xorriso, fall back to genisoimage/mkisofs. If efiboot_img is provided, embed it as El Torito EFI.
+    Prefer xorriso, fall back to genisoimage/mkisofs. If efiboot_img is provided, embed it as El Torito EFI
+    (xorriso: as an appended ESP partition; genisoimage/mkisofs: as efiboot.img inside the ISO tree).
+    With xorriso, `path_list` (ISO path -> host path, see build_path_list) can replace the staged isoroot;
+    genisoimage/mkisofs always need isoroot.
     """
-    xorriso = shutil.which("xorriso")
-    geniso = shutil.which("genisoimage") or shutil.which("mkisofs")
+    xorriso = _which("xorriso")
+    geniso = _which_first(("genisoimage", "mkisofs"))
 
-    # If efiboot_img is provided, xorriso wants that file to be present inside the ISO tree.
-    # Copy it into the isoroot (as efiboot.img at ISO root) and reference it by relative path.
-    efiboot_iso_path = None
-    if efiboot_img and efiboot_img.exists():
-        efiboot_iso_path = Path(isoroot) / "efiboot.img"
-        shutil.copy2(efiboot_img, efiboot_iso_path)
+    # Without efiboot_img the ISO gets no El Torito EFI entry at all. Pointing `-e` at
+    # EFI/BOOT/BOOTX64.EFI instead is not an option: UEFI firmware expects that entry to be a
+    # FAT filesystem image, and xorriso does not synthesize one from a bare PE file.
+    have_efiboot = bool(efiboot_img and efiboot_img.exists())
 
     if xorriso:
         cmd = [
@@ -197,17 +358,38 @@ def build_iso(iso_path: Path, isoroot: Path, efiboot_img: Path | None = None, vo
             "-o",
             str(iso_path),
         ]
-        if efiboot_iso_path and efiboot_iso_path.exists():
-            # pass the path inside the ISO (relative to ISO root)
-            cmd += ["-eltorito-alt-boot", "-e", str(efiboot_iso_path.name), "-no-emul-boot"]
-        cmd.append(str(isoroot))
-        run(cmd)
+        if have_efiboot:
+            # append the FAT image as partition 2 (type 0xef, ESP) straight from workdir and
+            # point the El Torito EFI entry at it, so it never has to be copied into isoroot
+            cmd += [
+                "-eltorito-alt-boot",
+                "-e",
+                "--interval:appended_partition_2:all::",
+                "-no-emul-boot",
+                "-append_partition",
+                "2",
+                "0xef",
+                str(efiboot_img),
+            ]
+        if path_list is not None:
+            # feed "iso_path=host_path" lines on stdin; xorriso reads every file where it lives.
+            # -follow-links stores what a symlink points to, as the staging copy does, rather
+            # than the link itself
+            text = "".join(f"{_graft_escape(iso)}={_graft_escape(host)}\n" for iso, host in path_list.items())
+            cmd += ["-follow-links", "-graft-points", "-path-list", "-"]
+            run(cmd, input=text, text=True)
+        else:
+            cmd.append(str(isoroot))
+            run(cmd)
         return
 
     if geniso:
         cmd = [geniso, "-r", "-J", "-V", volume_label, "-o", str(iso_path)]
-        if efiboot_iso_path and efiboot_iso_path.exists():
-            cmd += ["-eltorito-alt-boot", "-e", str(efiboot_iso_path.name), "-no-emul-boot"]
+        if have_efiboot:
+            # genisoimage/mkisofs can only boot from a file inside the ISO tree:
+            # put it at the ISO root as efiboot.img and reference it by relative path
+            _reflink(efiboot_img, Path(isoroot) / "efiboot.img")
+            cmd += ["-eltorito-alt-boot", "-e", "efiboot.img", "-no-emul-boot"]
         cmd.append(str(isoroot))
         run(cmd)
         return
@@ -215,14 +397,108 @@ def build_iso(iso_path: Path, isoroot: Path, efiboot_img: Path | None = None, vo
     raise RuntimeError("No supported ISO creation tool found (xorriso or genisoimage/mkisofs required)")
 
 
-def copy_tree_into(src: Path, dst: Path):
-    for p in src.rglob("*"):
-        if p.is_dir():
-            continue
-        rel = p.relative_to(src)
-        target = dst / rel
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(p, target)
+class _Copier(ThreadPoolExecutor):
+    """Thread pool that runs file copies concurrently.
+
+    `copy_fn` does the actual work for each file and returns its size (default: _fastcopy).
+    With `verbose`, each file is listed as it is queued; either way `files`/`bytes` hold the
+    totals after the `with` block exits, which is also where copy errors are re-raised.
+    """
+
+    def __init__(self, *args, copy_fn=None, verbose=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._copy_fn = copy_fn or _fastcopy
+        self._verbose = verbose
+        self._futures = []
+        self.files = 0
+        self.bytes = 0
+
+    def copy(self, src, dst):
+        if self._verbose:
+            sys.stdout.write(f"  {src} -> {dst}\n")
+        fut = self.submit(self._copy_fn, src, dst)
+        self._futures.append(fut)
+        return fut
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            for fut in self._futures:
+                self.bytes += fut.result()
+            self.files = len(self._futures)
+        return False
+
+
+def _scan_tree(src, dst, exclude=frozenset()):
+    """Walk src and return (dirs, files) mirrored under dst.
+
+    dirs lists dst itself and every subdirectory, parents first; files is a list of
+    (source path, destination path). Symlinked directories are not followed, and paths in
+    `exclude` (e.g. our own workdir when it lives under bin/) are skipped.
+    """
+    # walk with os.scandir so DirEntry's cached d_type avoids a stat() per entry
+    dirs = [os.fspath(dst)]
+    files = []
+    stack = [(os.fspath(src), dirs[0])]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if entry.path in exclude:
+                    continue
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(target)
+                    stack.append((entry.path, target))
+                elif entry.is_file():
+                    files.append((entry.path, target))
+    return dirs, files
+
+
+def _iter_bin_entries(bin_dir: Path, exclude=frozenset()):
+    """Yield the top-level entries of bin/ that belong in the ISO (no .o files, fs_tmp, .mnt or `exclude`)."""
+    with os.scandir(bin_dir) as it:
+        for entry in it:
+            if entry.name in _SKIP_BIN_ENTRIES or entry.path in exclude:
+                continue
+            if entry.is_dir() or (entry.is_file() and not entry.name.endswith(".o")):
+                yield entry
+
+
+def _graft_escape(path) -> str:
+    # xorriso -graft-points: '=' separates ISO and host path, so escape it (and '\\')
+    return os.fspath(path).replace("\\", "\\\\").replace("=", "\\=")
+
+
+def build_path_list(bootx64: Path, kernel: Path | None, fsimg: Path | None, bin_dir: Path, exclude=frozenset()) -> dict:
+    """Map ISO paths to host files, with the same layout main() stages into isoroot."""
+    paths = {"/EFI/BOOT/BOOTX64.EFI": bootx64}
+    if kernel:
+        paths["/kernel.bin"] = kernel
+    if bin_dir.exists():
+        for entry in _iter_bin_entries(bin_dir, exclude):
+            if entry.is_dir():
+                _, files = _scan_tree(entry.path, "/" + entry.name, exclude)
+                paths.update((iso, host) for host, iso in files)
+            else:
+                paths["/" + entry.name] = entry.path
+    if fsimg:
+        paths["/" + fsimg.name] = fsimg
+    return paths
+
+
+def copy_tree_into(src: Path, dst: Path, copier: _Copier, exclude=frozenset()):
+    # every destination directory is created exactly once (one mkdir each, parents first)
+    # on the calling thread before any file is handed to the pool
+    dirs, files = _scan_tree(src, dst, exclude)
+    for d in dirs:
+        try:
+            os.mkdir(d)
+        except FileExistsError:
+            pass
+
+    for s, d in files:
+        copier.copy(s, d)
 
 
 def main(argv=None):
@@ -232,12 +508,15 @@ def main(argv=None):
     p.add_argument("--no-fsimg", action="store_true",
                    help="do not include bin/fs.img (disable automatic inclusion)")
     p.add_argument("--no-efimg", action="store_true", help="do not create EFI FAT image, always embed EFI file directly in ISO")
-    p.add_argument("--workdir", help="temporary workdir (for debugging) — default: system tmp")
+    p.add_argument("--workdir", help="temporary workdir (for debugging) — default: a new directory next to the output ISO")
     p.add_argument("--usb-img", default="LiteCore.img",
-                   help="create a raw USB image (.img) in addition to ISO; path or filename (requires sudo). Default: LiteCore.img")
+                   help="create a raw USB image (.img) in addition to ISO; path or filename (needs parted, sfdisk, mkfs.vfat and mtools). Default: LiteCore.img")
     p.add_argument("--no-usb-img", action="store_true",
                    help="do not create a raw USB image (disable automatic creation)")
     p.add_argument("--usb-size", type=int, default=512, help="size in MiB for raw USB image (default: 256)")
+    p.add_argument("-v", "--verbose", action="store_true", help="list every file placed into the ISO")
+    p.add_argument("--fallocate", action="store_true",
+                   help="reserve the raw USB image's disk space up front instead of creating a sparse file")
     args = p.parse_args(argv)
 
     repo_root = Path(args.bin_dir).resolve()
@@ -252,55 +531,98 @@ def main(argv=None):
     kernel = found["kernel"]
     fsimg = found["fsimg"]
 
-    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="litecore-iso-"))
+    # default the workdir to the output ISO's directory rather than /tmp (often tmpfs or another
+    # device), so staging into it can hard-link/reflink instead of copying
+    if not args.workdir:
+        out_iso.parent.mkdir(parents=True, exist_ok=True)
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="litecore-iso-", dir=out_iso.parent))
     print("workdir:", workdir)
     workdir.mkdir(parents=True, exist_ok=True)
+    workdir = workdir.resolve()
 
-    isoroot = workdir / "iso_root"
-    if isoroot.exists():
-        shutil.rmtree(isoroot)
-    isoroot.mkdir()
-
-    # Populate EFI dir in isoroot
-    efi_dir = isoroot / "EFI" / "BOOT"
-    efi_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(bootx64, efi_dir / "BOOTX64.EFI")
-
-    # copy kernel as kernel.bin at ISO root (Makefile placed kernel.bin in ESP root)
-    if kernel:
-        shutil.copy2(kernel, isoroot / "kernel.bin")
-
-    # copy other useful bin content (bin/lib, bin/apps, README)
-    # copy everything under bin/* except object files
-    bin_dir = repo_root / "bin"
-    if bin_dir.exists():
-        for p in bin_dir.iterdir():
-            if p.name == ".mnt":
-                continue
-            # avoid copying .o and internal fs_tmp
-            if p.is_dir() and p.name not in ("fs_tmp",):
-                copy_tree_into(p, isoroot / p.name)
-            elif p.is_file() and not p.name.endswith(".o"):
-                shutil.copy2(p, isoroot / p.name)
-
-    # include fs image by default if present (can be disabled with --no-fsimg)
-    if (not args.no_fsimg) and fsimg:
-        shutil.copy2(fsimg, isoroot / fsimg.name)
-
-    efiboot_img = None
-    if not args.no_efimg:
-        # try to create a small EFI FAT image
-        efiboot_img = workdir / "efiboot.img"
-        success = create_efi_fat_image(efiboot_img, bootx64, kernel)
-        if not success:
-            print("Could not create EFI FAT image automatically (missing mkfs.vfat or mcopy). Will embed EFI file directly into ISO.")
-            efiboot_img = None
+    bin_dir = (repo_root / "bin").resolve()
+    include_fsimg = fsimg if (not args.no_fsimg) else None
 
+    efi_future = None
     try:
-        build_iso(out_iso, isoroot, efiboot_img)
-    except Exception as e:
-        print("ISO creation failed:", e, file=sys.stderr)
-        sys.exit(2)
+        # hard links are free but need workdir and the repo on one filesystem; check once here
+        # instead of letting every os.link() fail with EXDEV
+        same_fs = os.stat(repo_root).st_dev == os.stat(workdir).st_dev
+        copy_file = _link_or_copy if same_fs else _fastcopy
+
+        # the EFI FAT image only reads bootx64/kernel and writes workdir/efiboot.img (+ efi_stage),
+        # so build it in the background while the ISO contents are being gathered
+        if not args.no_efimg:
+            efi_pool = ThreadPoolExecutor(max_workers=1)
+            efi_future = efi_pool.submit(create_efi_fat_image, workdir / "efiboot.img", bootx64, kernel)
+            efi_pool.shutdown(wait=False)
+
+        # if the output (and so the default workdir) is under bin/, keep both out of the ISO;
+        # the EFI thread is also still writing into workdir while bin/ is walked
+        exclude = frozenset({os.fspath(workdir), os.fspath(out_iso)})
+
+        isoroot = None
+        path_list = None
+        if _which("xorriso"):
+            # xorriso reads the files in place from a path list, so nothing is staged
+            path_list = build_path_list(bootx64, kernel, include_fsimg, bin_dir, exclude)
+            if args.verbose:
+                sys.stdout.write("".join(f"  {host} -> {iso}\n" for iso, host in path_list.items()))
+            sys.stdout.write(f"listed {len(path_list)} files for xorriso (no staging copy)\n")
+            sys.stdout.flush()
+        else:
+            isoroot = workdir / "iso_root"
+            if isoroot.exists():
+                shutil.rmtree(isoroot)
+            isoroot.mkdir()
+
+            # Populate EFI dir in isoroot
+            efi_dir = isoroot / "EFI" / "BOOT"
+            efi_dir.mkdir(parents=True, exist_ok=True)
+            copy_file(bootx64, efi_dir / "BOOTX64.EFI")
+
+            # copy kernel as kernel.bin at ISO root (Makefile placed kernel.bin in ESP root)
+            if kernel:
+                copy_file(kernel, isoroot / "kernel.bin")
+
+            # copy other useful bin content (bin/lib, bin/apps, README)
+            # copy everything under bin/* except object files
+            if bin_dir.exists():
+                copier = _Copier(max_workers=min(32, (os.cpu_count() or 4) * 4), copy_fn=copy_file, verbose=args.verbose)
+                with copier:
+                    for entry in _iter_bin_entries(bin_dir, exclude):
+                        if entry.is_dir():
+                            copy_tree_into(Path(entry.path), isoroot / entry.name, copier, exclude)
+                        else:
+                            copier.copy(entry.path, isoroot / entry.name)
+
+                sys.stdout.write(f"copied {copier.files} files, {copier.bytes / (1024 * 1024):.1f} MiB from {bin_dir}\n")
+                sys.stdout.flush()
+
+            # include fs image by default if present (can be disabled with --no-fsimg)
+            if include_fsimg:
+                copy_file(include_fsimg, isoroot / include_fsimg.name)
+
+        efiboot_img = None
+        if efi_future is not None:
+            if efi_future.result():
+                efiboot_img = workdir / "efiboot.img"
+            else:
+                print("Could not create EFI FAT image automatically (missing mkfs.vfat or mcopy). Will embed EFI file directly into ISO.")
+                print("Note: without the FAT image the ISO has no El Torito EFI entry; install dosfstools and mtools for a UEFI-bootable ISO.")
+
+        try:
+            build_iso(out_iso, isoroot, efiboot_img, path_list=path_list)
+        except Exception as e:
+            print("ISO creation failed:", e, file=sys.stderr)
+            sys.exit(2)
+    finally:
+        # an auto-created workdir sits next to the output ISO (possibly inside the repo), so
+        # don't leave it behind; only an explicit --workdir is kept for debugging
+        if not args.workdir:
+            if efi_future is not None:
+                efi_future.exception()  # wait until the EFI thread stops writing into workdir
+            shutil.rmtree(workdir, ignore_errors=True)
 
     if not args.no_usb_img and args.usb_img:
         usb_path = Path(args.usb_img)
@@ -312,14 +634,15 @@ def main(argv=None):
                 print("Failed to remove existing USB image:", e, file=sys.stderr)
                 sys.exit(3)
         try:
-            create_raw_usb_image(usb_path, bootx64, kernel, fsimg if (not args.no_fsimg) else None, size_mb=args.usb_size)
+            create_raw_usb_image(usb_path, bootx64, kernel, include_fsimg, size_mb=args.usb_size,
+                                 fallocate=args.fallocate)
             print("Raw USB image created:", usb_path)
         except Exception as e:
             print("Failed to create raw USB image:", e, file=sys.stderr)
-            print("Note: creating raw image requires 'sudo' for losetup/parted/mkfs/mount operations.")
+            print("Note: creating raw image requires parted, sfdisk (util-linux), mkfs.vfat (dosfstools) and mcopy (mtools).")
             sys.exit(4)
 
-    isohybrid = shutil.which("isohybrid")
+    isohybrid = _which("isohybrid")
     if isohybrid:
         try:
             print("Running isohybrid --uefi on", out_iso)
@@ -336,7 +659,8 @@ def main(argv=None):
 
     print("ISO created:", out_iso)
     print("You can write the ISO to USB with Rufus or dd. If using Rufus, select 'DD Image' mode for raw write.")
-    print("Temporary workdir kept at:", workdir)
+    if args.workdir:
+        print("Temporary workdir kept at:", workdir)
 
 
 # Wow! I've never seen such a crappy Main function! Hey Python! I'm looking at you!